@@ -1,5 +1,6 @@
 import sqlite3
 import json
+import os
 from datetime import datetime
 from typing import List, Dict, Optional
 
@@ -12,7 +13,11 @@ class EarthquakeDatabase:
         self.init_database()
 
     def init_database(self):
-        """Initialize database tables."""
+        """Initialize database tables and indexes."""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -61,9 +66,33 @@ class EarthquakeDatabase:
             )
         ''')
 
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_earthquakes_time ON earthquakes (time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_earthquakes_magnitude ON earthquakes (magnitude)')
+
         conn.commit()
         conn.close()
 
+    def warm_up(self) -> Dict:
+        """
+        Touch the tables and indexes so the first real request does not pay
+        for cold SQLite pages.
+
+        Returns:
+            Dict with the names of the indexes found on the earthquakes table
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT COUNT(*) FROM earthquakes')
+        cursor.execute('SELECT MAX(time) FROM earthquakes')
+        cursor.execute('SELECT MAX(magnitude) FROM earthquakes')
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'earthquakes'")
+        indexes = [row[0] for row in cursor.fetchall()]
+
+        conn.close()
+
+        return {'indexes': indexes}
+
     def save_earthquakes(self, earthquakes: List[Dict], time_range: str) -> int:
         """
         Save earthquake data to database.
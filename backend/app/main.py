@@ -1,18 +1,80 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
+import asyncio
 import os
 
-from scraper import EarthquakeScraper
-from database import EarthquakeDatabase
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_db_path() -> str:
+    """
+    Resolve the database path independently of the working directory.
+
+    DATABASE_PATH may be absolute or relative to the backend directory.
+    """
+    db_path = os.environ.get("DATABASE_PATH", os.path.join("data", "earthquakes.db"))
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(BACKEND_DIR, db_path)
+    return db_path
+
+
+# Set up in the lifespan handler so importing this module stays cheap.
+db = None
+
+readiness = {
+    "database": False,
+    "indexes": False,
+    "cache": False,
+    "started_at": None,
+    "ready_at": None,
+    "error": None
+}
+
+
+def _warm_up_database():
+    """Warm SQLite pages and record which indexes are in place."""
+    result = db.warm_up()
+    readiness["indexes"] = all(
+        name in result["indexes"] for name in ("idx_earthquakes_time", "idx_earthquakes_magnitude")
+    )
+    readiness["cache"] = True
+
+
+async def _warm_up():
+    """Run the warm-up off the event loop so startup is not blocked."""
+    try:
+        await asyncio.to_thread(_warm_up_database)
+        readiness["ready_at"] = datetime.now().isoformat()
+    except Exception as e:
+        readiness["error"] = str(e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database and schema on startup, then warm caches in the background."""
+    global db
+    from database import EarthquakeDatabase
+
+    readiness["started_at"] = datetime.now().isoformat()
+    db = EarthquakeDatabase(db_path=resolve_db_path())
+    readiness["database"] = True
+
+    warm_up_task = asyncio.create_task(_warm_up())
+    yield
+    warm_up_task.cancel()
 
 
 app = FastAPI(
     title="Earthquake Data API",
     description="API for scraping and retrieving earthquake data from USGS",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -23,9 +85,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-db = EarthquakeDatabase(db_path="../data/earthquakes.db")
-
-
 class EarthquakeResponse(BaseModel):
     id: str
     title: Optional[str]
@@ -66,7 +125,8 @@ async def root():
             "GET /earthquakes/location": "Filter by location",
             "GET /statistics": "Get statistics",
             "POST /scrape": "Scrape new data from USGS",
-            "GET /health": "Health check"
+            "GET /health": "Health check",
+            "GET /ready": "Readiness check"
         }
     }
 
@@ -77,6 +137,29 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint.
+
+    Returns 503 until the database is open and its caches and indexes are warm.
+    """
+    ready = readiness["database"] and readiness["indexes"] and readiness["cache"]
+    body = {
+        "status": "ready" if ready else "starting",
+        "checks": {
+            "database": readiness["database"],
+            "indexes": readiness["indexes"],
+            "cache": readiness["cache"]
+        },
+        "started_at": readiness["started_at"],
+        "ready_at": readiness["ready_at"],
+        "error": readiness["error"],
+        "timestamp": datetime.now().isoformat()
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
+
 @app.post("/scrape")
 async def scrape_earthquakes(request: ScrapeRequest):
     """
@@ -85,6 +168,8 @@ async def scrape_earthquakes(request: ScrapeRequest):
     Args:
         time_range: One of 'hour', 'day', 'week', 'month'
     """
+    from scraper import EarthquakeScraper
+
     try:
         scraper = EarthquakeScraper()
         success = scraper.fetch_data(time_range=request.time_range)
@@ -217,8 +302,6 @@ async def clear_all_data():
 if __name__ == "__main__":
     import uvicorn
 
-    os.makedirs("../data", exist_ok=True)
-
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
@@ -0,0 +1,126 @@
+"""
+Startup-time benchmark for the Earthquake Data API.
+
+Measures, over several fresh processes:
+- import time of the main module
+- latency from process start to the first successful GET /health
+- latency from process start to the first successful GET /ready
+
+Usage (from the backend directory):
+    python benchmarks/startup_benchmark.py --runs 5
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from statistics import mean, median
+from typing import Dict, List, Optional
+
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def free_port() -> int:
+    """Ask the OS for an unused local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: Dict) -> float:
+    """Return the time in seconds to import the main module in a fresh interpreter."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SNIPPET], cwd=APP_DIR, env=env, text=True
+    )
+    return float(output.strip().splitlines()[-1])
+
+
+def wait_for(url: str, start: float, timeout: float) -> Optional[float]:
+    """Poll a URL until it returns 200 and return the elapsed time since start."""
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.getcode() == 200:
+                    return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.005)
+    return None
+
+
+def measure_first_request(env: Dict, timeout: float) -> Dict:
+    """Start a server process and time the first /health and /ready responses."""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=APP_DIR,
+        env=env,
+    )
+    try:
+        health = wait_for(f"{base_url}/health", start, timeout)
+        ready = wait_for(f"{base_url}/ready", start, timeout)
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {"health": health, "ready": ready}
+
+
+def summarize(label: str, values: List[Optional[float]]):
+    """Print min/median/mean/max in milliseconds for a list of timings."""
+    timings = [v for v in values if v is not None]
+    if not timings:
+        print(f"{label:<24} no successful runs")
+        return
+    print(
+        f"{label:<24} min {min(timings) * 1000:8.1f} ms  "
+        f"median {median(timings) * 1000:8.1f} ms  "
+        f"mean {mean(timings) * 1000:8.1f} ms  "
+        f"max {max(timings) * 1000:8.1f} ms  "
+        f"({len(timings)}/{len(values)} ok)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API startup latency")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh processes per measurement")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each endpoint")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ)
+        env["DATABASE_PATH"] = os.path.join(tmp_dir, "earthquakes.db")
+
+        import_times = []
+        health_times = []
+        ready_times = []
+
+        for _ in range(args.runs):
+            import_times.append(measure_import(env))
+            result = measure_first_request(env, args.timeout)
+            health_times.append(result["health"])
+            ready_times.append(result["ready"])
+
+    print(f"Startup benchmark ({args.runs} runs)")
+    summarize("import main", import_times)
+    summarize("start -> GET /health", health_times)
+    summarize("start -> GET /ready", ready_times)
+
+
+if __name__ == "__main__":
+    main()